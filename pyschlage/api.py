@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from .auth import Auth
+from .auth import Auth, decode_json
 from .lock import Lock
 from .user import User
 
@@ -28,7 +28,7 @@ class Schlage:
         path = Lock.request_path()
         response = self._auth.request("get", path, params={"archetype": "lock"})
         locks = []
-        for lock_json in response.json():
+        for lock_json in decode_json(response):
             lock = Lock.from_json(self._auth, lock_json)
             lock.refresh_access_codes()
             locks.append(lock)
@@ -43,4 +43,4 @@ class Schlage:
         """
         path = User.request_path()
         response = self._auth.request("get", path)
-        return [User.from_json(u) for u in response.json()]
+        return [User.from_json(u) for u in decode_json(response)]
@@ -2,17 +2,31 @@
 
 from __future__ import annotations
 
-from functools import wraps
-from typing import Callable
+from functools import cached_property, wraps
+from typing import TYPE_CHECKING, Any, Callable
 
 from botocore.exceptions import ClientError
 import pycognito
 from pycognito import utils
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
-from .exceptions import NotAuthorizedError, UnknownError
+from .exceptions import Error, NotAuthorizedError, UnknownError
+
+if TYPE_CHECKING:
+    from urllib3 import BaseHTTPResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 _DEFAULT_TIMEOUT = 60
+_HTTP_ERRORS: dict[int, type[Error]] = {401: NotAuthorizedError}
+_POOL_CONNECTIONS = 4
+_POOL_MAXSIZE = 10
+# Upper bound on how long a Retry-After header may delay the next attempt.
+_MAX_RETRY_AFTER = 5
 _NOT_AUTHORIZED_ERRORS = (
     "NotAuthorizedException",
     "InvalidPasswordException",
@@ -28,6 +42,44 @@ USER_POOL_REGION = "us-west-2"
 USER_POOL_ID = USER_POOL_REGION + "_2zhrVs9d4"
 
 
+class _Retry(Retry):
+    """Retry policy that caps the delay requested by Retry-After headers."""
+
+    def get_retry_after(self, response: BaseHTTPResponse) -> float | None:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, _MAX_RETRY_AFTER)
+
+
+# Only urllib3's default idempotent methods (GET, PUT, DELETE, HEAD, OPTIONS,
+# TRACE) are retried on these statuses; POST requests such as device commands
+# and notifications are not.
+_MAX_RETRIES = _Retry(
+    total=3,
+    # Don't resend a request once the server may have received it; the request
+    # timeout would otherwise apply to every attempt.
+    read=False,
+    backoff_factor=0.2,
+    status_forcelist=(429, 502, 503, 504),
+    respect_retry_after_header=True,
+    # Let the final response through so _translate_http_errors can handle it.
+    raise_on_status=False,
+)
+
+
+def decode_json(resp: requests.Response) -> Any:
+    """Decodes the JSON body of a response.
+
+    Uses orjson when it is installed, otherwise falls back to requests.
+
+    :meta private:
+    """
+    if orjson is None:
+        return resp.json()
+    return orjson.loads(resp.content)
+
+
 def _translate_auth_errors(
     # pylint: disable=invalid-name
     fn: Callable[..., requests.Response],
@@ -61,10 +113,10 @@ def _translate_http_errors(
             return resp
         except requests.HTTPError as ex:
             try:
-                message = resp.json().get("message", resp.reason)
-            except requests.JSONDecodeError:
+                message = decode_json(resp).get("message", resp.reason)
+            except ValueError:
                 message = resp.reason
-            raise UnknownError(message) from ex
+            raise _HTTP_ERRORS.get(resp.status_code, UnknownError)(message) from ex
 
     return wrapper
 
@@ -91,7 +143,19 @@ class Auth:
             password=password,
             cognito=self.cognito,
         )
-        self._user_id: str | None = None
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=_POOL_CONNECTIONS,
+                pool_maxsize=_POOL_MAXSIZE,
+                max_retries=_MAX_RETRIES,
+            ),
+        )
+
+    def close(self) -> None:
+        """Closes the HTTP session and releases its pooled connections."""
+        self._session.close()
 
     @_translate_auth_errors
     def authenticate(self):
@@ -102,16 +166,11 @@ class Auth:
         """
         self.auth(requests.Request())
 
-    @property
+    @cached_property
     def user_id(self) -> str:
         """Returns the unique user id for the authenticated user."""
-        if self._user_id is None:
-            self._user_id = self._get_user_id()
-        return self._user_id
-
-    def _get_user_id(self) -> str:
         resp = self.request("get", "users/@me")
-        return resp.json()["identityId"]
+        return decode_json(resp)["identityId"]
 
     @_translate_http_errors
     @_translate_auth_errors
@@ -127,5 +186,8 @@ class Auth:
             kwargs["headers"] = {}
         kwargs["headers"]["X-Api-Key"] = API_KEY
         kwargs.setdefault("timeout", _DEFAULT_TIMEOUT)
+        if orjson is not None and "json" in kwargs:
+            kwargs["data"] = orjson.dumps(kwargs.pop("json"))
+            kwargs["headers"]["Content-Type"] = "application/json"
         # pylint: disable=missing-timeout
-        return requests.request(method, f"{base_url}/{path.lstrip('/')}", **kwargs)
+        return self._session.request(method, f"{base_url}/{path.lstrip('/')}", **kwargs)
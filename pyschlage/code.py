@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import astuple, dataclass, field
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
-from .auth import Auth
+from .auth import Auth, decode_json
 from .common import Mutable
 from .device import Device
 from .exceptions import NotAuthenticatedError
@@ -19,9 +20,20 @@ _MIN_MINUTE = 0
 _MAX_HOUR = 23
 _MAX_MINUTE = 59
 _ALL_DAYS = "7F"
+_DEFAULT_CODE_LENGTH = 4
+# Indexed by the 7-bit day mask, with Sunday as the most significant bit.
+_DAYS_STRS = [hex(n).lstrip("0x").upper() for n in range(1 << 7)]
+_DAYS_BITS = [
+    tuple((n & (1 << i)) != 0 for i in reversed(range(7))) for n in range(1 << 7)
+]
 
 
-@dataclass
+@lru_cache(maxsize=256)
+def _format_code(code: int, length: int) -> str:
+    return f"{code:0{length}}"
+
+
+@dataclass(slots=True, weakref_slot=True)
 class TemporarySchedule:
     """A temporary schedule for when an AccessCode is enabled."""
 
@@ -53,7 +65,7 @@ class TemporarySchedule:
         }
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class DaysOfWeek:
     """Enabled status for each day of the week."""
 
@@ -71,21 +83,25 @@ class DaysOfWeek:
 
         :meta private:
         """
-        n = int(s, 16)
-        return cls(*[(n & (1 << i)) != 0 for i in reversed(range(7))])
+        return cls(*_DAYS_BITS[int(s, 16) & 0x7F])
 
     def to_str(self) -> str:
         """Returns the string representation.
 
         :meta private:
         """
-        n = 0
-        for d in astuple(self):
-            n = (n << 1) | d
-        return hex(n).lstrip("0x").upper()
-
-
-@dataclass
+        return _DAYS_STRS[
+            self.sun << 6
+            | self.mon << 5
+            | self.tue << 4
+            | self.wed << 3
+            | self.thu << 2
+            | self.fri << 1
+            | self.sat
+        ]
+
+
+@dataclass(slots=True, weakref_slot=True)
 class RecurringSchedule:
     """A recurring schedule for when an AccessCode is enabled."""
 
@@ -142,7 +158,7 @@ class RecurringSchedule:
         }
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class AccessCode(Mutable):
     """An access code for a lock."""
 
@@ -194,14 +210,17 @@ class AccessCode(Mutable):
         else:
             schedule = TemporarySchedule.from_json(json)
 
-        access_code_length = json.get("accessCodeLength", 4)
+        code = _format_code(
+            json["accessCode"], json.get("accessCodeLength", _DEFAULT_CODE_LENGTH)
+        )
+
         return AccessCode(
             _auth=auth,
             _json=json,
             _device=device,
             access_code_id=json["accesscodeId"],
             name=json["friendlyName"],
-            code=f"{json['accessCode']:0{access_code_length}}",
+            code=code,
             notify_on_use=bool(json["notification"]),
             disabled=bool(json.get("disabled", None)),
             schedule=schedule,
@@ -222,14 +241,15 @@ class AccessCode(Mutable):
             "disabled": int(self.disabled),
             "activationSecs": _MIN_TIME,
             "expirationSecs": _MAX_TIME,
-            "schedule1": RecurringSchedule().to_json(),
         }
         if self.access_code_id:
             json["accesscodeId"] = self.access_code_id
         if isinstance(self.schedule, RecurringSchedule):
             json["schedule1"] = self.schedule.to_json()
-        elif self.schedule is not None:
-            json.update(self.schedule.to_json())
+        else:
+            json["schedule1"] = RecurringSchedule().to_json()
+            if self.schedule is not None:
+                json.update(self.schedule.to_json())
 
         return json
 
@@ -250,7 +270,7 @@ class AccessCode(Mutable):
 
         # NOTE: We don't call self._update_with() here because the API only returns
         # the accesscodeId field.
-        resp_json = resp.json()
+        resp_json = decode_json(resp)
         if "accesscodeId" in resp_json:
             self.access_code_id = resp_json["accesscodeId"]
 
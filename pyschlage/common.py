@@ -5,6 +5,7 @@ from __future__ import annotations
 from copy import deepcopy
 from dataclasses import dataclass, field, fields
 from datetime import UTC, datetime
+from functools import cache, lru_cache
 from threading import Lock as Mutex
 from time import mktime
 from typing import Any
@@ -12,7 +13,13 @@ from typing import Any
 from .auth import Auth
 
 
-@dataclass
+@cache
+def _state_fields(cls: type) -> tuple[str, ...]:
+    """Returns the names of the fields that make up an object's state."""
+    return tuple(f.name for f in fields(cls) if f.name != "_mu")
+
+
+@dataclass(slots=True, weakref_slot=True)
 class Mutable:
     """Base class for models which have mutable state."""
 
@@ -20,19 +27,18 @@ class Mutable:
     _auth: Auth | None = field(default=None, repr=False)
 
     def __getstate__(self):
-        state = self.__dict__.copy()
-        del state["_mu"]
-        return state
+        return {name: getattr(self, name) for name in _state_fields(type(self))}
 
     def __setstate__(self, state):
-        self.__dict__.update(state)
+        for name, value in state.items():
+            setattr(self, name, value)
         self._mu = Mutex()
 
     def _update_with(self, json, *args, **kwargs):
         new_obj = self.__class__.from_json(self._auth, json, *args, **kwargs)
         with self._mu:
-            for f in fields(new_obj):
-                setattr(self, f.name, getattr(new_obj, f.name))
+            for name in _state_fields(type(new_obj)):
+                setattr(self, name, getattr(new_obj, name))
 
 
 def utc2local(utc: datetime) -> datetime:
@@ -44,6 +50,7 @@ def utc2local(utc: datetime) -> datetime:
     return (utc + offset).replace(tzinfo=None)
 
 
+@lru_cache(maxsize=1024)
 def fromisoformat(dt: str) -> datetime:
     """Converts an ISO formatted datetime into a datetime object."""
     # datetime.fromisoformat() doesn't like fractional seconds with a "Z" suffix.
@@ -52,23 +59,32 @@ def fromisoformat(dt: str) -> datetime:
 
 def redact(json: dict[Any, Any], *, allowed: list[str]) -> dict[str, Any]:
     """Returns a copy of the given JSON dict with non-allowed keys redacted."""
-    if len(allowed) == 1 and allowed[0] == "*":
-        return deepcopy(json)
+    return _redact(json, _compile_allowed(allowed))
+
 
-    allowed_here: dict[str, list[str]] = {}
+def _compile_allowed(allowed: list[str]) -> dict[str, Any]:
+    """Compiles dotted allow rules into a trie of nested dicts.
+
+    A "*" key in a node means everything beneath that node is allowed.
+    """
+    trie: dict[str, Any] = {}
     for allow in allowed:
-        k, _, children = allow.partition(".")
-        if k not in allowed_here:
-            allowed_here[k] = []
-        if not children:
-            children = "*"
-        allowed_here[k].append(children)
+        node = trie
+        for k in allow.split("."):
+            node = node.setdefault(k, {})
+        node["*"] = {}
+    return trie
+
+
+def _redact(json: dict[Any, Any], allowed: dict[str, Any]) -> dict[str, Any]:
+    if "*" in allowed:
+        return deepcopy(json)
 
     ret: dict[str, Any] = {}
     for k, v in json.items():
         if isinstance(v, dict):
-            ret[k] = redact(v, allowed=allowed_here.get(k, []))
-        elif k in allowed_here:
+            ret[k] = _redact(v, allowed.get(k, {}))
+        elif k in allowed:
             ret[k] = v
         else:
             if isinstance(v, list):
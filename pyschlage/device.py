@@ -34,7 +34,7 @@ class DeviceType(str, Enum):
     SENSE = "be479"
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class Device(Mutable):
     """Base class for Schlage devices."""
 
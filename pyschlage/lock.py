@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Iterable
 
-from .auth import Auth
+from .auth import Auth, decode_json
 from .code import AccessCode
 from .common import redact
 from .device import Device
@@ -15,7 +15,7 @@ from .notification import ON_UNLOCK_ACTION, Notification
 from .user import User
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class LockStateMetadata:
     """Metadata about the current lock state."""
 
@@ -40,7 +40,7 @@ class LockStateMetadata:
         return cls(action_type=json["actionType"], uuid=json["UUID"], name=json["name"])
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class Lock(Device):
     """A Schlage WiFi lock."""
 
@@ -105,8 +105,9 @@ class Lock(Device):
         is_locked = is_jammed = None
         attributes = json["attributes"]
         if "lockState" in attributes:
-            is_locked = attributes["lockState"] == 1
-            is_jammed = attributes["lockState"] == 2
+            lock_state = attributes["lockState"]
+            is_locked = lock_state == 1
+            is_jammed = lock_state == 2
 
         lock_state_metadata = None
         if "lockStateMetadata" in attributes:
@@ -201,14 +202,14 @@ class Lock(Device):
         if not self._auth:
             raise NotAuthenticatedError
         path = self.request_path(self.device_id)
-        self._update_with(self._auth.request("get", path).json())
+        self._update_with(decode_json(self._auth.request("get", path)))
         self.refresh_access_codes()
 
     def _put_attributes(self, attributes):
         path = self.request_path(self.device_id)
         json = {"attributes": attributes}
         resp = self._auth.request("put", path, json=json)
-        self._update_with(resp.json())
+        self._update_with(decode_json(resp))
 
     def _toggle(self, lock_state: int):
         if not self._auth:
@@ -307,7 +308,7 @@ class Lock(Device):
         if sort_desc:
             params["sort"] = "desc"
         resp = self._auth.request("get", path, params=params)
-        return [LockLog.from_json(lock_log) for lock_log in resp.json()]
+        return [LockLog.from_json(lock_log) for lock_log in decode_json(resp)]
 
     def refresh_access_codes(self) -> None:
         """Fetches access codes for this lock.
@@ -341,7 +342,7 @@ class Lock(Device):
                 notifications[access_code_id] = notification
         path = AccessCode.request_path(self.device_id)
         resp = self._auth.request("get", path)
-        for code_json in resp.json():
+        for code_json in decode_json(resp):
             access_code = AccessCode.from_json(self._auth, self, code_json)
             access_code.device_id = self.device_id
             if access_code.access_code_id in notifications:
@@ -354,7 +355,7 @@ class Lock(Device):
         path = Notification.request_path()
         params = {"deviceId": self.device_id}
         resp = self._auth.request("get", path, params=params)
-        for notification_json in resp.json():
+        for notification_json in decode_json(resp):
             notification = Notification.from_json(self._auth, notification_json)
             notification.device_type = self.device_type
             yield notification
@@ -57,7 +57,7 @@ LOG_EVENT_TYPES = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class LockLog:
     """A lock log entry."""
 
@@ -87,13 +87,12 @@ class LockLog:
 
         :meta private:
         """
-
-        def none_if_default(attr):
-            return None if attr == _DEFAULT_UUID else attr
-
+        message = json["message"]
+        accessor_id = message["accessorUuid"]
+        access_code_id = message["keypadUuid"]
         return cls(
             created_at=utc2local(fromisoformat(json["createdAt"])),
-            accessor_id=none_if_default(json["message"]["accessorUuid"]),
-            access_code_id=none_if_default(json["message"]["keypadUuid"]),
-            message=LOG_EVENT_TYPES.get(json["message"]["eventCode"], "Unknown"),
+            accessor_id=None if accessor_id == _DEFAULT_UUID else accessor_id,
+            access_code_id=None if access_code_id == _DEFAULT_UUID else access_code_id,
+            message=LOG_EVENT_TYPES.get(message["eventCode"], "Unknown"),
         )
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
-from .auth import Auth
+from .auth import Auth, decode_json
 from .common import Mutable, fromisoformat
 from .exceptions import NotAuthenticatedError
 
@@ -17,7 +17,7 @@ ON_UNLOCKED = "onstateunlocked"
 UNKNOWN = "__unknown__"
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class Notification(Mutable):
     """A Schlage WiFi lock notification."""
 
@@ -79,7 +79,7 @@ class Notification(Mutable):
         method = "put" if self.created_at else "post"
         path = self.request_path(self.notification_id)
         resp = self._auth.request(method, path, self.to_json())
-        self._update_with(resp.json())
+        self._update_with(decode_json(resp))
 
     def delete(self):
         """Deletes the notification."""
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class User:
     """A Schlage API user account."""
 
@@ -13,9 +13,16 @@ from pyschlage.log import LockLog
 from pyschlage.notification import ON_UNLOCK_ACTION, Notification
 
 
+@fixture(scope="session")
+def _mock_auth_spec():
+    # Autospeccing introspects the whole class, so only do it once.
+    return create_autospec(Auth, spec_set=True, user_id="<user-id>")
+
+
 @fixture
-def mock_auth():
-    yield create_autospec(Auth, spec_set=True, user_id="<user-id>")
+def mock_auth(_mock_auth_spec):
+    yield _mock_auth_spec
+    _mock_auth_spec.reset_mock(return_value=True, side_effect=True)
 
 
 @fixture
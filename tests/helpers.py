@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from json import dumps
+from typing import Any
+
+
+class FakeResponse:
+    """A minimal stand-in for a requests.Response with a JSON body."""
+
+    __slots__ = ("_json", "content")
+
+    def __init__(self, json: Any):
+        self._json = json
+        self.content = dumps(json).encode()
+
+    def json(self) -> Any:
+        return self._json
+
+    def raise_for_status(self) -> None:
+        pass
@@ -5,6 +5,8 @@ from unittest import mock
 
 from pyschlage import api
 
+from tests.helpers import FakeResponse
+
 
 def test_locks(
     mock_auth: mock.Mock,
@@ -14,28 +16,22 @@ def test_locks(
 ) -> None:
     schlage = api.Schlage(mock_auth)
     mock_auth.request.side_effect = [
-        mock.Mock(json=mock.Mock(return_value=[lock_json])),
-        mock.Mock(json=mock.Mock(return_value=[notification_json])),
-        mock.Mock(json=mock.Mock(return_value=[access_code_json])),
+        FakeResponse([lock_json]),
+        FakeResponse([notification_json]),
+        FakeResponse([access_code_json]),
     ]
     locks = schlage.locks()
     assert len(locks) == 1
-    mock_auth.request.assert_has_calls(
-        [
-            mock.call("get", "devices", params={"archetype": "lock"}),
-            mock.call(
-                "get", "notifications", params={"deviceId": lock_json["deviceId"]}
-            ),
-            mock.call("get", "devices/__wifi_uuid__/storage/accesscode"),
-        ]
-    )
+    assert mock_auth.request.call_args_list == [
+        mock.call("get", "devices", params={"archetype": "lock"}),
+        mock.call("get", "notifications", params={"deviceId": lock_json["deviceId"]}),
+        mock.call("get", "devices/__wifi_uuid__/storage/accesscode"),
+    ]
 
 
 def test_users(mock_auth: mock.Mock, lock_users_json: list[dict]) -> None:
     schlage = api.Schlage(mock_auth)
-    mock_auth.request.return_value = mock.Mock(
-        json=mock.Mock(return_value=lock_users_json)
-    )
+    mock_auth.request.return_value = FakeResponse(lock_users_json)
 
     users = schlage.users()
     assert len(users) == 2
@@ -1,53 +1,109 @@
+from types import SimpleNamespace
 from unittest import mock
 
 from botocore.exceptions import ClientError
 import pytest
 import requests
+from urllib3 import HTTPResponse
 
 import pyschlage
 from pyschlage import auth as _auth
 
+from tests.helpers import FakeResponse
 
-@mock.patch("requests.Request")
-@mock.patch("pycognito.utils.RequestsSrpAuth")
-@mock.patch("pycognito.Cognito")
-def test_authenticate(mock_cognito, mock_srp_auth, mock_request):
+
+@pytest.fixture
+def deps(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    cognito = mock.Mock()
+    srp_auth = mock.Mock()
+    session = mock.Mock()
+    adapter = mock.Mock()
+    monkeypatch.setattr("pycognito.Cognito", cognito)
+    monkeypatch.setattr("pycognito.utils.RequestsSrpAuth", srp_auth)
+    monkeypatch.setattr("requests.Session", session)
+    monkeypatch.setattr(_auth, "HTTPAdapter", adapter)
+    return SimpleNamespace(
+        cognito=cognito,
+        srp_auth=srp_auth,
+        session=session,
+        adapter=adapter,
+        request=session.return_value.request,
+    )
+
+
+def test_authenticate(deps: SimpleNamespace, monkeypatch: pytest.MonkeyPatch):
+    mock_request = mock.Mock()
+    monkeypatch.setattr("requests.Request", mock_request)
     auth = _auth.Auth("__username__", "__password__")
 
-    mock_cognito.assert_called_once()
-    assert mock_cognito.call_args.kwargs["username"] == "__username__"
+    deps.cognito.assert_called_once()
+    assert deps.cognito.call_args.kwargs["username"] == "__username__"
 
-    mock_srp_auth.assert_called_once_with(
-        password="__password__", cognito=mock_cognito.return_value
+    deps.srp_auth.assert_called_once_with(
+        password="__password__", cognito=deps.cognito.return_value
     )
 
     auth.authenticate()
-    mock_srp_auth.return_value.assert_called_once_with(mock_request.return_value)
+    deps.srp_auth.return_value.assert_called_once_with(mock_request.return_value)
 
 
-@mock.patch("requests.request")
-@mock.patch("pycognito.utils.RequestsSrpAuth")
-@mock.patch("pycognito.Cognito")
-def test_request(mock_cognito, mock_srp_auth, mock_request):
+def test_request(deps: SimpleNamespace):
     auth = _auth.Auth("__username__", "__password__")
     auth.request("get", "/foo/bar", baz="bam")
-    mock_request.assert_called_once_with(
+    deps.request.assert_called_once_with(
         "get",
         "https://api.allegion.yonomi.cloud/v1/foo/bar",
         timeout=60,
-        auth=mock_srp_auth.return_value,
+        auth=deps.srp_auth.return_value,
         headers={"X-Api-Key": _auth.API_KEY},
         baz="bam",
     )
 
 
-@mock.patch("requests.request", spec=True)
-@mock.patch("pycognito.utils.RequestsSrpAuth", spec=True)
-@mock.patch("pycognito.Cognito")
-def test_request_not_authorized(mock_cognito, mock_srp_auth, mock_request):
+def test_session_adapter(deps: SimpleNamespace):
+    _auth.Auth("__username__", "__password__")
+    deps.adapter.assert_called_once_with(
+        pool_connections=4, pool_maxsize=10, max_retries=_auth._MAX_RETRIES
+    )
+    deps.session.return_value.mount.assert_called_once_with(
+        "https://", deps.adapter.return_value
+    )
+    assert _auth._MAX_RETRIES.total == 3
+    assert _auth._MAX_RETRIES.read is False
+    assert not _auth._MAX_RETRIES.raise_on_status
+
+
+@pytest.mark.parametrize(
+    "retry_after,want", [(None, None), ("1", 1), ("600", _auth._MAX_RETRY_AFTER)]
+)
+def test_retry_after_is_capped(retry_after: str | None, want: float | None):
+    headers = {} if retry_after is None else {"Retry-After": retry_after}
+    resp = HTTPResponse(status=429, headers=headers)
+    assert _auth._MAX_RETRIES.get_retry_after(resp) == want
+    # Retries derived from the policy after each attempt keep the cap.
+    retries = _auth._MAX_RETRIES.increment("GET", "/", response=resp)
+    assert isinstance(retries, _auth._Retry)
+    with mock.patch("urllib3.util.retry.time.sleep") as sleep:
+        retries.sleep(resp)
+    if want is not None:
+        sleep.assert_called_once_with(want)
+
+
+def test_post_is_not_retried_on_status():
+    assert not _auth._MAX_RETRIES.is_retry("POST", 429, has_retry_after=True)
+    assert _auth._MAX_RETRIES.is_retry("GET", 429, has_retry_after=True)
+
+
+def test_close(deps: SimpleNamespace):
+    auth = _auth.Auth("__username__", "__password__")
+    auth.close()
+    deps.session.return_value.close.assert_called_once_with()
+
+
+def test_request_not_authorized(deps: SimpleNamespace):
     url = "https://api.allegion.yonomi.cloud/v1/foo/bar"
     auth = _auth.Auth("__username__", "__password__")
-    mock_request.side_effect = ClientError(
+    deps.request.side_effect = ClientError(
         {
             "Error": {
                 "Code": "NotAuthorizedException",
@@ -62,20 +118,17 @@ def test_request_not_authorized(mock_cognito, mock_srp_auth, mock_request):
     ):
         auth.request("get", "/foo/bar", baz="bam")
 
-    mock_request.assert_called_once_with(
+    deps.request.assert_called_once_with(
         "get",
         url,
         timeout=60,
-        auth=mock_srp_auth.return_value,
+        auth=deps.srp_auth.return_value,
         headers={"X-Api-Key": _auth.API_KEY},
         baz="bam",
     )
 
 
-@mock.patch("requests.request", spec=True)
-@mock.patch("pycognito.utils.RequestsSrpAuth", spec=True)
-@mock.patch("pycognito.Cognito")
-def test_request_unknown_error(mock_cognito, mock_srp_auth, mock_request):
+def test_request_unknown_error(deps: SimpleNamespace):
     url = "https://api.allegion.yonomi.cloud/v1/foo/bar"
     auth = _auth.Auth("__username__", "__password__")
     mock_resp = mock.create_autospec(requests.Response)
@@ -84,74 +137,140 @@ def test_request_unknown_error(mock_cognito, mock_srp_auth, mock_request):
     )
     mock_resp.status_code = 500
     mock_resp.reason = "Internal"
+    mock_resp.content = b"<html></html>"
     mock_resp.json.side_effect = requests.JSONDecodeError("msg", "doc", 1)
-    mock_request.return_value = mock_resp
+    deps.request.return_value = mock_resp
 
     with pytest.raises(pyschlage.exceptions.UnknownError):
         auth.request("get", "/foo/bar", baz="bam")
 
-    mock_request.assert_called_once_with(
+    deps.request.assert_called_once_with(
         "get",
         url,
         timeout=60,
-        auth=mock_srp_auth.return_value,
+        auth=deps.srp_auth.return_value,
         headers={"X-Api-Key": _auth.API_KEY},
         baz="bam",
     )
 
 
-@mock.patch("requests.request")
-@mock.patch("pycognito.utils.RequestsSrpAuth")
-@mock.patch("pycognito.Cognito")
-def test_user_id(mock_cognito, mock_srp_auth, mock_request):
+def test_request_http_not_authorized(deps: SimpleNamespace):
+    url = "https://api.allegion.yonomi.cloud/v1/foo/bar"
     auth = _auth.Auth("__username__", "__password__")
-    mock_request.return_value = mock.Mock(
-        json=mock.Mock(
-            return_value={
-                "consentRecords": [],
-                "created": "2022-12-24T20:00:00.000Z",
-                "email": "asdf@asdf.com",
-                "friendlyName": "username",
-                "identityId": "<user-id>",
-                "lastUpdated": "2022-12-24T20:00:00.000Z",
-            }
-        )
+    mock_resp = mock.create_autospec(requests.Response)
+    mock_resp.raise_for_status.side_effect = requests.HTTPError(
+        f"401 Client Error: Unauthorized for url: {url}"
+    )
+    mock_resp.status_code = 401
+    mock_resp.reason = "Unauthorized"
+    mock_resp.content = b"<html></html>"
+    mock_resp.json.side_effect = requests.JSONDecodeError("msg", "doc", 1)
+    deps.request.return_value = mock_resp
+
+    with pytest.raises(pyschlage.exceptions.NotAuthorizedError):
+        auth.request("get", "/foo/bar")
+
+
+def test_request_error_message(deps: SimpleNamespace):
+    url = "https://api.allegion.yonomi.cloud/v1/foo/bar"
+    auth = _auth.Auth("__username__", "__password__")
+    mock_resp = mock.create_autospec(requests.Response)
+    mock_resp.raise_for_status.side_effect = requests.HTTPError(
+        f"400 Client Error: Bad Request for url: {url}"
+    )
+    mock_resp.status_code = 400
+    mock_resp.reason = "Bad Request"
+    mock_resp.content = b'{"message": "Invalid access code"}'
+    mock_resp.json.return_value = {"message": "Invalid access code"}
+    deps.request.return_value = mock_resp
+
+    with pytest.raises(pyschlage.exceptions.UnknownError, match="Invalid access code"):
+        auth.request("get", "/foo/bar")
+
+
+def test_request_json(deps: SimpleNamespace):
+    auth = _auth.Auth("__username__", "__password__")
+    auth.request("put", "/foo/bar", json={"baz": "bam"})
+    deps.request.assert_called_once_with(
+        "put",
+        "https://api.allegion.yonomi.cloud/v1/foo/bar",
+        timeout=60,
+        auth=deps.srp_auth.return_value,
+        headers={"X-Api-Key": _auth.API_KEY, "Content-Type": "application/json"},
+        data=b'{"baz":"bam"}',
+    )
+
+
+def test_request_json_no_orjson(deps: SimpleNamespace, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(_auth, "orjson", None)
+    auth = _auth.Auth("__username__", "__password__")
+    auth.request("put", "/foo/bar", json={"baz": "bam"})
+    deps.request.assert_called_once_with(
+        "put",
+        "https://api.allegion.yonomi.cloud/v1/foo/bar",
+        timeout=60,
+        auth=deps.srp_auth.return_value,
+        headers={"X-Api-Key": _auth.API_KEY},
+        json={"baz": "bam"},
+    )
+
+
+def test_user_id(deps: SimpleNamespace):
+    auth = _auth.Auth("__username__", "__password__")
+    deps.request.return_value = FakeResponse(
+        {
+            "consentRecords": [],
+            "created": "2022-12-24T20:00:00.000Z",
+            "email": "asdf@asdf.com",
+            "friendlyName": "username",
+            "identityId": "<user-id>",
+            "lastUpdated": "2022-12-24T20:00:00.000Z",
+        }
     )
     assert auth.user_id == "<user-id>"
-    mock_request.assert_called_once_with(
+    deps.request.assert_called_once_with(
         "get",
         "https://api.allegion.yonomi.cloud/v1/users/@me",
         timeout=60,
-        auth=mock_srp_auth.return_value,
+        auth=deps.srp_auth.return_value,
         headers={"X-Api-Key": _auth.API_KEY},
     )
 
 
-@mock.patch("requests.request")
-@mock.patch("pycognito.utils.RequestsSrpAuth")
-@mock.patch("pycognito.Cognito")
-def test_user_id_is_cached(mock_cognito, mock_srp_auth, mock_request):
+def test_user_id_is_cached(deps: SimpleNamespace):
     auth = _auth.Auth("__username__", "__password__")
-    mock_request.return_value = mock.Mock(
-        json=mock.Mock(
-            return_value={
-                "consentRecords": [],
-                "created": "2022-12-24T20:00:00.000Z",
-                "email": "asdf@asdf.com",
-                "friendlyName": "username",
-                "identityId": "<user-id>",
-                "lastUpdated": "2022-12-24T20:00:00.000Z",
-            }
-        )
+    deps.request.return_value = FakeResponse(
+        {
+            "consentRecords": [],
+            "created": "2022-12-24T20:00:00.000Z",
+            "email": "asdf@asdf.com",
+            "friendlyName": "username",
+            "identityId": "<user-id>",
+            "lastUpdated": "2022-12-24T20:00:00.000Z",
+        }
     )
     assert auth.user_id == "<user-id>"
-    mock_request.assert_called_once_with(
+    deps.request.assert_called_once_with(
         "get",
         "https://api.allegion.yonomi.cloud/v1/users/@me",
         timeout=60,
-        auth=mock_srp_auth.return_value,
+        auth=deps.srp_auth.return_value,
         headers={"X-Api-Key": _auth.API_KEY},
     )
-    mock_request.reset_mock()
+    deps.request.reset_mock()
     assert auth.user_id == "<user-id>"
-    mock_request.assert_not_called()
+    deps.request.assert_not_called()
+
+
+def test_decode_json():
+    resp = mock.create_autospec(requests.Response)
+    resp.content = b'{"foo": "bar"}'
+    assert _auth.decode_json(resp) == {"foo": "bar"}
+    resp.json.assert_not_called()
+
+
+def test_decode_json_no_orjson(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(_auth, "orjson", None)
+    resp = mock.create_autospec(requests.Response)
+    resp.json.return_value = {"foo": "bar"}
+    assert _auth.decode_json(resp) == {"foo": "bar"}
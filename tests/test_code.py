@@ -1,7 +1,8 @@
-from copy import deepcopy
+from __future__ import annotations
+
 from datetime import datetime
 from typing import Any
-from unittest.mock import Mock, create_autospec, patch
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -10,70 +11,70 @@ from pyschlage.device import Device
 from pyschlage.exceptions import NotAuthenticatedError
 from pyschlage.notification import Notification
 
+from tests.helpers import FakeResponse
+
 
 class TestAccessCode:
+    @pytest.mark.parametrize(
+        "schedule,overrides",
+        [
+            (None, {}),
+            (
+                RecurringSchedule(days_of_week=DaysOfWeek(mon=False)),
+                {
+                    "schedule1": {
+                        "daysOfWeek": "5F",
+                        "startHour": 0,
+                        "startMinute": 0,
+                        "endHour": 23,
+                        "endMinute": 59,
+                    }
+                },
+            ),
+            (
+                TemporarySchedule(
+                    start=datetime(2022, 12, 25, 8, 30, 0),
+                    end=datetime(2022, 12, 25, 9, 0, 0),
+                ),
+                {"activationSecs": 1671957000, "expirationSecs": 1671958800},
+            ),
+        ],
+        ids=["none", "recurring", "temporary"],
+    )
     def test_to_from_json(
-        self, mock_auth: Mock, access_code_json: dict[str, Any], wifi_device: Device
+        self,
+        mock_auth: Mock,
+        access_code_json: dict[str, Any],
+        wifi_device: Device,
+        schedule: TemporarySchedule | RecurringSchedule | None,
+        overrides: dict[str, Any],
     ):
-        access_code_id = "__access_code_uuid__"
+        access_code_json.update(overrides)
         code = AccessCode(
             _auth=mock_auth,
             _device=wifi_device,
             _json=access_code_json,
             name="Friendly name",
             code="0123",
-            schedule=None,
+            schedule=schedule,
             device_id=wifi_device.device_id,
-            access_code_id=access_code_id,
+            access_code_id="__access_code_uuid__",
         )
         assert AccessCode.from_json(mock_auth, wifi_device, access_code_json) == code
         assert code.to_json() == access_code_json
 
-    def test_to_from_json_recurring_schedule(
+    def test_from_json_code_length(
         self, mock_auth: Mock, access_code_json: dict[str, Any], wifi_device: Device
     ):
+        access_code_json["accessCode"] = 1234
+        access_code_json["accessCodeLength"] = 6
+        code = AccessCode.from_json(mock_auth, wifi_device, access_code_json)
+        assert code.code == "001234"
+        assert code.to_json() == access_code_json
+
+    def test_recurring_schedule_from_empty_json(self):
         assert RecurringSchedule.from_json({}) is None
         assert RecurringSchedule.from_json(None) is None
-        access_code_id = "__access_code_uuid__"
-        sched = RecurringSchedule(days_of_week=DaysOfWeek(mon=False))
-        json = deepcopy(access_code_json)
-        json["schedule1"] = sched.to_json()
-        code = AccessCode(
-            _auth=mock_auth,
-            _json=json,
-            _device=wifi_device,
-            name="Friendly name",
-            code="0123",
-            schedule=sched,
-            device_id=wifi_device.device_id,
-            access_code_id=access_code_id,
-        )
-        assert AccessCode.from_json(mock_auth, wifi_device, json) == code
-        assert code.to_json() == json
-
-    def test_to_from_json_temporary_schedule(
-        self, mock_auth: Mock, access_code_json: dict[str, Any], wifi_device: Device
-    ):
-        access_code_id = "__access_code_uuid__"
-        sched = TemporarySchedule(
-            start=datetime(2022, 12, 25, 8, 30, 0),
-            end=datetime(2022, 12, 25, 9, 0, 0),
-        )
-        json = deepcopy(access_code_json)
-        json["activationSecs"] = 1671957000
-        json["expirationSecs"] = 1671958800
-        code = AccessCode(
-            _auth=mock_auth,
-            _json=json,
-            _device=wifi_device,
-            name="Friendly name",
-            code="0123",
-            schedule=sched,
-            device_id=wifi_device.device_id,
-            access_code_id=access_code_id,
-        )
-        assert AccessCode.from_json(mock_auth, wifi_device, json) == code
-        assert code.to_json() == json
 
     def test_save(
         self,
@@ -82,7 +83,7 @@ class TestAccessCode:
     ):
         with pytest.raises(NotAuthenticatedError):
             AccessCode().save()
-        mock_device = create_autospec(Device, spec_set=True, device_id="__wifi_uuid__")
+        mock_device = Mock(spec=Device, device_id="__wifi_uuid__")
         code = AccessCode.from_json(mock_auth, mock_device, access_code_json)
         code.code = "1122"
         old_json = code.to_json()
@@ -92,11 +93,9 @@ class TestAccessCode:
         with patch(
             "pyschlage.code.Notification", autospec=True
         ) as mock_notification_cls:
-            mock_notification = create_autospec(Notification, spec_set=True)
+            mock_notification = Mock(spec=Notification)
             mock_notification_cls.return_value = mock_notification
-            mock_device.send_command.return_value = Mock(
-                json=Mock(return_value=new_json)
-            )
+            mock_device.send_command.return_value = FakeResponse(new_json)
             code.save()
             mock_notification.save.assert_called_once_with()
             mock_device.send_command.assert_called_once_with(
@@ -108,9 +107,9 @@ class TestAccessCode:
     def test_delete(self, mock_auth: Mock, access_code_json: dict[str, Any]):
         with pytest.raises(NotAuthenticatedError):
             AccessCode().delete()
-        mock_device = create_autospec(Device, spec_set=True, device_id="__wifi_uuid__")
+        mock_device = Mock(spec=Device, device_id="__wifi_uuid__")
         code = AccessCode.from_json(mock_auth, mock_device, access_code_json)
-        mock_notification = create_autospec(Notification, spec_set=True)
+        mock_notification = Mock(spec=Notification)
         code._notification = mock_notification
         mock_auth.request.return_value = Mock()
         json = code.to_json()
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime
 from pickle import dumps, loads
 from typing import Any
+import weakref
 
 import pytest
 
 from pyschlage import common
+from pyschlage.code import AccessCode, DaysOfWeek, RecurringSchedule, TemporarySchedule
+from pyschlage.device import Device
+from pyschlage.lock import Lock, LockStateMetadata
+from pyschlage.log import LockLog
+from pyschlage.notification import Notification
+from pyschlage.user import User
 
 
 def test_pickle_unpickle() -> None:
@@ -16,8 +24,36 @@ def test_pickle_unpickle() -> None:
     assert mut2._auth == mut._auth
 
 
-@pytest.fixture
+@pytest.mark.parametrize(
+    "obj",
+    [
+        common.Mutable(),
+        Device(),
+        Lock(),
+        LockStateMetadata(action_type="thumbTurn"),
+        AccessCode(),
+        DaysOfWeek(),
+        RecurringSchedule(),
+        TemporarySchedule(start=datetime(2023, 1, 1), end=datetime(2023, 1, 2)),
+        LockLog(created_at=datetime(2023, 1, 1), message="Unlocked by keypad"),
+        Notification(),
+        User(),
+    ],
+    ids=lambda obj: type(obj).__name__,
+)
+def test_weakref(obj: Any) -> None:
+    assert weakref.ref(obj)() is obj
+
+
+def test_fromisoformat() -> None:
+    dt = common.fromisoformat("2023-03-01T17:26:47.366Z")
+    assert dt == datetime(2023, 3, 1, 17, 26, 47, 366000, tzinfo=UTC)
+    assert common.fromisoformat("2023-03-01T17:26:47.366Z") is dt
+
+
+@pytest.fixture(scope="module")
 def json_dict() -> dict[Any, Any]:
+    # Shared across tests, so tests must not mutate it.
     return {
         "a": "foo",
         "b": 1,
@@ -80,3 +116,7 @@ def test_redact_partial(json_dict: dict[Any, Any]):
         "d": ["<REDACTED>"],
     }
     assert common.redact(json_dict, allowed=["a", "b", "c.c0"]) == want
+
+
+def test_redact_overlapping(json_dict: dict[Any, Any]):
+    assert common.redact(json_dict, allowed=["a", "b", "c", "c.c0", "d"]) == json_dict
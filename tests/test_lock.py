@@ -3,7 +3,7 @@ from __future__ import annotations
 from copy import deepcopy
 from datetime import datetime
 from typing import Any
-from unittest.mock import Mock, call, patch
+from unittest.mock import Mock, call
 
 import pytest
 
@@ -14,6 +14,21 @@ from pyschlage.log import LockLog
 from pyschlage.notification import Notification
 from pyschlage.user import User
 
+from tests.helpers import FakeResponse
+
+_UNLOCKED_AT_0 = LockLog(
+    created_at=datetime(2023, 1, 1, 0, 0, 0), message="Unlocked by keypad"
+)
+_UNLOCKED_AT_1 = LockLog(
+    created_at=datetime(2023, 1, 1, 1, 0, 0), message="Unlocked by keypad"
+)
+_DISABLED_AT_0 = LockLog(
+    created_at=datetime(2023, 1, 1, 0, 0, 0), message="Keypad disabled invalid code"
+)
+_DISABLED_AT_1 = LockLog(
+    created_at=datetime(2023, 1, 1, 1, 0, 0), message="Keypad disabled invalid code"
+)
+
 
 class TestLock:
     def test_from_json(self, mock_auth, lock_json):
@@ -52,11 +67,23 @@ class TestLock:
         lock = Lock.from_json(mock_auth, lock_json)
         assert not lock.connected
 
-    def test_from_json_is_jammed(self, mock_auth, lock_json):
-        lock_json["attributes"]["lockState"] = 2
+    @pytest.mark.parametrize(
+        "lock_state,is_locked,is_jammed",
+        [(0, False, False), (1, True, False), (2, False, True)],
+        ids=["unlocked", "locked", "jammed"],
+    )
+    def test_from_json_lock_state(
+        self,
+        mock_auth: Mock,
+        lock_json: dict[Any, Any],
+        lock_state: int,
+        is_locked: bool,
+        is_jammed: bool,
+    ) -> None:
+        lock_json["attributes"]["lockState"] = lock_state
         lock = Lock.from_json(mock_auth, lock_json)
-        assert lock.is_locked is False
-        assert lock.is_jammed
+        assert lock.is_locked is is_locked
+        assert lock.is_jammed is is_jammed
 
     def test_from_json_wifi_lock_unavailable(
         self, mock_auth, wifi_lock_unavailable_json
@@ -76,68 +103,20 @@ class TestLock:
 
     def test_diagnostics(self, mock_auth: Mock, lock_json: dict) -> None:
         lock = Lock.from_json(mock_auth, lock_json)
-        want = {
-            "CAT": "<REDACTED>",
-            "SAT": "<REDACTED>",
-            "attributes": {
-                "CAT": "<REDACTED>",
-                "SAT": "<REDACTED>",
-                "accessCodeLength": 4,
-                "actAlarmBuzzerEnabled": 0,
-                "actAlarmState": 0,
-                "actuationCurrentMax": 226,
-                "alarmSelection": 0,
-                "alarmSensitivity": 0,
-                "alarmState": 0,
-                "autoLockTime": 0,
-                "batteryChangeDate": 1669017530,
-                "batteryLevel": 95,
-                "batteryLowState": 0,
-                "batterySaverConfig": {"activePeriod": [], "enabled": 0},
-                "batterySaverState": 0,
-                "beeperEnabled": 1,
-                "bleFirmwareVersion": "0118.000103.015",
-                "diagnostics": {},
-                "firmwareUpdate": {
-                    "status": {"additionalInfo": None, "updateStatus": None}
-                },
-                "homePosCurrentMax": 153,
-                "keypadFirmwareVersion": "03.00.00250052",
-                "lockAndLeaveEnabled": 1,
-                "lockState": 1,
-                "lockStateMetadata": {
-                    "UUID": None,
-                    "actionType": "periodicDeepQuery",
-                    "clientId": None,
-                    "name": None,
-                },
-                "macAddress": "<REDACTED>",
-                "mainFirmwareVersion": "10.00.00264232",
-                "mode": 2,
-                "modelName": "__model_name__",
-                "periodicDeepQueryTimeSetting": 60,
-                "psPollEnabled": 1,
-                "serialNumber": "<REDACTED>",
-                "timezone": -20,
-                "wifiFirmwareVersion": "03.15.00.01",
-                "wifiRssi": -42,
-            },
-            "connected": True,
-            "connectivityUpdated": "2022-12-04T20:58:22.000Z",
-            "created": "2020-04-05T21:53:11.000Z",
-            "deviceId": "<REDACTED>",
-            "devicetypeId": "be489wifi",
-            "lastUpdated": "2022-12-04T20:58:22.000Z",
-            "macAddress": "<REDACTED>",
-            "modelName": "__model_name__",
-            "name": "Door Lock",
-            "physicalId": "<REDACTED>",
-            "relatedDevices": ["<REDACTED>"],
-            "role": "owner",
-            "serialNumber": "<REDACTED>",
-            "timezone": -20,
-            "users": ["<REDACTED>"],
-        }
+        want = deepcopy(lock_json)
+        for key in (
+            "CAT",
+            "SAT",
+            "deviceId",
+            "macAddress",
+            "physicalId",
+            "serialNumber",
+        ):
+            want[key] = "<REDACTED>"
+        for key in ("CAT", "SAT", "macAddress", "serialNumber"):
+            want["attributes"][key] = "<REDACTED>"
+        want["relatedDevices"] = ["<REDACTED>"]
+        want["users"] = ["<REDACTED>"]
         assert lock.get_diagnostics() == want
 
     def test_refresh(
@@ -150,95 +129,61 @@ class TestLock:
         with pytest.raises(NotAuthenticatedError):
             Lock().refresh()
         lock = Lock.from_json(mock_auth, lock_json)
+        mu = lock._mu
         lock_json["name"] = "<NAME>"
 
         mock_auth.request.side_effect = [
-            Mock(json=Mock(return_value=lock_json)),
-            Mock(json=Mock(return_value=[notification_json])),
-            Mock(json=Mock(return_value=[access_code_json])),
+            FakeResponse(lock_json),
+            FakeResponse([notification_json]),
+            FakeResponse([access_code_json]),
         ]
         lock.refresh()
 
-        mock_auth.request.assert_has_calls(
-            [
-                call("get", "devices/__wifi_uuid__"),
-                call(
-                    "get", "notifications", params={"deviceId": lock_json["deviceId"]}
-                ),
-                call("get", "devices/__wifi_uuid__/storage/accesscode"),
-            ]
-        )
+        assert mock_auth.request.call_args_list == [
+            call("get", "devices/__wifi_uuid__"),
+            call("get", "notifications", params={"deviceId": lock_json["deviceId"]}),
+            call("get", "devices/__wifi_uuid__/storage/accesscode"),
+        ]
         assert lock.name == "<NAME>"
+        assert lock._mu is mu
 
     def test_send_command_unauthenticated(self):
         with pytest.raises(NotAuthenticatedError):
             Lock().send_command("foo", data={"bar": "baz"})
 
-    def test_lock_wifi(self, mock_auth, wifi_lock_json):
-        initial_json = deepcopy(wifi_lock_json)
-        initial_json["attributes"]["lockState"] = 0
-        lock = Lock.from_json(mock_auth, initial_json)
-
-        new_json = deepcopy(wifi_lock_json)
-        new_json["attributes"]["lockState"] = 1
-
-        mock_auth.request.return_value = Mock(json=Mock(return_value=new_json))
-        lock.lock()
-
-        mock_auth.request.assert_called_once_with(
-            "put", "devices/__wifi_uuid__", json={"attributes": {"lockState": 1}}
-        )
-        assert lock.is_locked
-
-    def test_unlock_wifi(self, mock_auth, wifi_lock_json):
-        initial_json = deepcopy(wifi_lock_json)
-        initial_json["attributes"]["lockState"] = 1
-        lock = Lock.from_json(mock_auth, initial_json)
-
-        new_json = deepcopy(wifi_lock_json)
-        new_json["attributes"]["lockState"] = 0
-
-        mock_auth.request.return_value = Mock(json=Mock(return_value=new_json))
-        lock.unlock()
-
-        mock_auth.request.assert_called_once_with(
-            "put", "devices/__wifi_uuid__", json={"attributes": {"lockState": 0}}
-        )
-        assert not lock.is_locked
+    @pytest.mark.parametrize("action,initial,final", [("lock", 0, 1), ("unlock", 1, 0)])
+    def test_lock_unlock_wifi(
+        self, mock_auth, wifi_lock_json, action: str, initial: int, final: int
+    ):
+        wifi_lock_json["attributes"]["lockState"] = initial
+        lock = Lock.from_json(mock_auth, wifi_lock_json)
 
-    def test_lock_ble(self, mock_auth, ble_lock_json):
-        with pytest.raises(NotAuthenticatedError):
-            Lock().lock()
+        new_json = {
+            **wifi_lock_json,
+            "attributes": {**wifi_lock_json["attributes"], "lockState": final},
+        }
 
-        lock = Lock.from_json(mock_auth, ble_lock_json)
-        lock.lock()
+        mock_auth.request.return_value = FakeResponse(new_json)
+        getattr(lock, action)()
 
-        command_json = {
-            "data": {
-                "CAT": "abcdef",
-                "deviceId": "__ble_uuid__",
-                "state": 1,
-                "userId": "<user-id>",
-            },
-            "name": "changelockstate",
-        }
         mock_auth.request.assert_called_once_with(
-            "post", "devices/__ble_uuid__/commands", json=command_json
+            "put", "devices/__wifi_uuid__", json={"attributes": {"lockState": final}}
         )
-        assert lock.is_locked
+        assert lock.is_locked == bool(final)
 
-    def test_unlock_ble(self, mock_auth, ble_lock_json):
+    @pytest.mark.parametrize("action,final", [("lock", 1), ("unlock", 0)])
+    def test_lock_unlock_ble(self, mock_auth, ble_lock_json, action: str, final: int):
         with pytest.raises(NotAuthenticatedError):
-            Lock().unlock()
+            getattr(Lock(), action)()
 
         lock = Lock.from_json(mock_auth, ble_lock_json)
-        lock.unlock()
+        getattr(lock, action)()
 
         command_json = {
             "data": {
                 "CAT": "abcdef",
                 "deviceId": "__ble_uuid__",
-                "state": 0,
+                "state": final,
                 "userId": "<user-id>",
             },
             "name": "changelockstate",
@@ -246,7 +191,7 @@ class TestLock:
         mock_auth.request.assert_called_once_with(
             "post", "devices/__ble_uuid__/commands", json=command_json
         )
-        assert not lock.is_locked
+        assert lock.is_locked == bool(final)
 
     def test_logs(
         self,
@@ -258,14 +203,14 @@ class TestLock:
         with pytest.raises(NotAuthenticatedError):
             Lock().logs()
 
-        mock_auth.request.return_value = Mock(json=Mock(return_value=[log_json]))
+        mock_auth.request.return_value = FakeResponse([log_json])
         assert wifi_lock.logs(limit=10, sort_desc=True) == [lock_log]
         mock_auth.request.assert_called_once_with(
             "get", "devices/__wifi_uuid__/logs", params={"limit": 10, "sort": "desc"}
         )
 
         mock_auth.reset_mock()
-        mock_auth.request.return_value = Mock(json=Mock(return_value=[log_json]))
+        mock_auth.request.return_value = FakeResponse([log_json])
         assert wifi_lock.logs() == [lock_log]
         mock_auth.request.assert_called_once_with(
             "get", "devices/__wifi_uuid__/logs", params={}
@@ -284,17 +229,15 @@ class TestLock:
         lock = Lock.from_json(mock_auth, lock_json)
 
         mock_auth.request.side_effect = [
-            Mock(json=Mock(return_value=[notification_json])),
-            Mock(json=Mock(return_value=[access_code_json])),
+            FakeResponse([notification_json]),
+            FakeResponse([access_code_json]),
         ]
         lock.refresh_access_codes()
 
-        mock_auth.request.assert_has_calls(
-            [
-                call("get", "notifications", params={"deviceId": lock.device_id}),
-                call("get", "devices/__wifi_uuid__/storage/accesscode"),
-            ]
-        )
+        assert mock_auth.request.call_args_list == [
+            call("get", "notifications", params={"deviceId": lock.device_id}),
+            call("get", "devices/__wifi_uuid__/storage/accesscode"),
+        ]
         notification.device_type = lock.device_type
         want_code = AccessCode.from_json(mock_auth, lock, access_code_json)
         want_code.device_id = lock.device_id
@@ -321,27 +264,25 @@ class TestLock:
 
         notification_json["active"] = False
         mock_auth.request.side_effect = [
-            Mock(json=Mock(return_value=access_code_json)),
-            Mock(json=Mock(return_value=notification_json)),
+            FakeResponse(access_code_json),
+            FakeResponse(notification_json),
         ]
         lock.add_access_code(code)
 
         del notification_json["createdAt"]
         del notification_json["updatedAt"]
-        mock_auth.request.assert_has_calls(
-            [
-                call(
-                    "post",
-                    "devices/__wifi_uuid__/commands",
-                    json={"data": json, "name": "addaccesscode"},
-                ),
-                call(
-                    "post",
-                    "notifications/<user-id>___access_code_uuid__",
-                    notification_json,
-                ),
-            ]
-        )
+        assert mock_auth.request.call_args_list == [
+            call(
+                "post",
+                "devices/__wifi_uuid__/commands",
+                json={"data": json, "name": "addaccesscode"},
+            ),
+            call(
+                "post",
+                "notifications/<user-id>___access_code_uuid__",
+                notification_json,
+            ),
+        ]
         assert code._auth == mock_auth
         assert code.device_id == lock.device_id
         assert code.access_code_id == "__access_code_uuid__"
@@ -351,7 +292,7 @@ class TestLock:
     ) -> None:
         assert wifi_lock.beeper_enabled
         wifi_lock_json["attributes"]["beeperEnabled"] = 0
-        mock_auth.request.return_value = Mock(json=Mock(return_value=wifi_lock_json))
+        mock_auth.request.return_value = FakeResponse(wifi_lock_json)
         wifi_lock.set_beeper(False)
         mock_auth.request.assert_called_once_with(
             "put", "devices/__wifi_uuid__", json={"attributes": {"beeperEnabled": 0}}
@@ -363,7 +304,7 @@ class TestLock:
     ) -> None:
         assert wifi_lock.lock_and_leave_enabled
         wifi_lock_json["attributes"]["lockAndLeaveEnabled"] = 0
-        mock_auth.request.return_value = Mock(json=Mock(return_value=wifi_lock_json))
+        mock_auth.request.return_value = FakeResponse(wifi_lock_json)
         wifi_lock.set_lock_and_leave(False)
         mock_auth.request.assert_called_once_with(
             "put",
@@ -380,7 +321,7 @@ class TestLock:
 
         assert wifi_lock.auto_lock_time == 0
         wifi_lock_json["attributes"]["autoLockTime"] = 15
-        mock_auth.request.return_value = Mock(json=Mock(return_value=wifi_lock_json))
+        mock_auth.request.return_value = FakeResponse(wifi_lock_json)
         wifi_lock.set_auto_lock_time(15)
         mock_auth.request.assert_called_once_with(
             "put",
@@ -392,106 +333,81 @@ class TestLock:
 
 class TestKeypadDisabled:
     def test_true(self, wifi_lock: Lock) -> None:
-        logs = [
-            LockLog(
-                created_at=datetime(2023, 1, 1, 0, 0, 0),
-                message="Unlocked by keypad",
-            ),
-            LockLog(
-                created_at=datetime(2023, 1, 1, 1, 0, 0),
-                message="Keypad disabled invalid code",
-            ),
-        ]
+        logs = [_UNLOCKED_AT_0, _DISABLED_AT_1]
         assert wifi_lock.keypad_disabled(logs) is True
 
     def test_true_unsorted(self, wifi_lock: Lock) -> None:
-        logs = [
-            LockLog(
-                created_at=datetime(2023, 1, 1, 1, 0, 0),
-                message="Keypad disabled invalid code",
-            ),
-            LockLog(
-                created_at=datetime(2023, 1, 1, 0, 0, 0),
-                message="Unlocked by keypad",
-            ),
-        ]
+        logs = [_DISABLED_AT_1, _UNLOCKED_AT_0]
         assert wifi_lock.keypad_disabled(logs) is True
 
     def test_false(self, wifi_lock: Lock) -> None:
-        logs = [
-            LockLog(
-                created_at=datetime(2023, 1, 1, 0, 0, 0),
-                message="Keypad disabled invalid code",
-            ),
-            LockLog(
-                created_at=datetime(2023, 1, 1, 1, 0, 0),
-                message="Unlocked by keypad",
-            ),
-        ]
+        logs = [_DISABLED_AT_0, _UNLOCKED_AT_1]
         assert wifi_lock.keypad_disabled(logs) is False
 
-    def test_fetches_logs(self, wifi_lock: Mock) -> None:
-        with patch.object(wifi_lock, "logs") as logs_mock:
-            logs_mock.return_value = [
-                LockLog(
-                    created_at=datetime(2023, 1, 1, 0, 0, 0),
-                    message="Unlocked by keypad",
-                ),
-                LockLog(
-                    created_at=datetime(2023, 1, 1, 1, 0, 0),
-                    message="Keypad disabled invalid code",
-                ),
-            ]
-            assert wifi_lock.keypad_disabled() is True
-            wifi_lock.logs.assert_called_once_with()
-
-    def test_fetches_logs_no_logs(self, wifi_lock: Lock) -> None:
-        with patch.object(wifi_lock, "logs") as logs_mock:
-            logs_mock.return_value = []
-            assert wifi_lock.keypad_disabled() is False
-            logs_mock.assert_called_once_with()
+    def test_fetches_logs(
+        self, wifi_lock: Lock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = []
 
+        def logs(self: Lock) -> list[LockLog]:
+            calls.append(self)
+            return [_UNLOCKED_AT_0, _DISABLED_AT_1]
 
-class TestChangedBy:
-    def test_thumbturn(self, wifi_lock: Lock) -> None:
-        assert wifi_lock.lock_state_metadata is not None
-        wifi_lock.lock_state_metadata.action_type = "thumbTurn"
-        assert wifi_lock.last_changed_by() == "thumbturn"
+        monkeypatch.setattr(Lock, "logs", logs)
+        assert wifi_lock.keypad_disabled() is True
+        assert calls == [wifi_lock]
 
-    def test_one_touch_locking(self, wifi_lock: Lock) -> None:
-        assert wifi_lock.lock_state_metadata is not None
-        wifi_lock.lock_state_metadata.action_type = "1touchLocking"
-        assert wifi_lock.last_changed_by() == "1-touch locking"
+    def test_fetches_logs_no_logs(
+        self, wifi_lock: Lock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = []
 
-    def test_nfc_device(self, wifi_lock: Lock) -> None:
-        assert wifi_lock.lock_state_metadata is not None
-        wifi_lock.lock_state_metadata.action_type = "AppleHomeNFC"
-        wifi_lock.lock_state_metadata.uuid = "user-uuid"
-        assert wifi_lock.last_changed_by() == "apple nfc device - asdf"
+        def logs(self: Lock) -> list[LockLog]:
+            calls.append(self)
+            return []
 
-    def test_nfc_device_no_uuid(self, wifi_lock: Lock) -> None:
-        assert wifi_lock.lock_state_metadata is not None
-        wifi_lock.lock_state_metadata.action_type = "AppleHomeNFC"
-        wifi_lock.lock_state_metadata.uuid = None
-        assert wifi_lock.last_changed_by() == "apple nfc device"
+        monkeypatch.setattr(Lock, "logs", logs)
+        assert wifi_lock.keypad_disabled() is False
+        assert calls == [wifi_lock]
 
-    def test_keypad(self, wifi_lock: Lock) -> None:
-        assert wifi_lock.lock_state_metadata is not None
-        wifi_lock.lock_state_metadata.action_type = "accesscode"
-        wifi_lock.lock_state_metadata.name = "secret code"
-        assert wifi_lock.last_changed_by() == "keypad - secret code"
 
-    def test_mobile_device(self, wifi_lock: Lock) -> None:
+class TestChangedBy:
+    @pytest.mark.parametrize(
+        "action_type,uuid,name,want",
+        [
+            ("thumbTurn", None, None, "thumbturn"),
+            ("1touchLocking", None, None, "1-touch locking"),
+            ("AppleHomeNFC", "user-uuid", None, "apple nfc device - asdf"),
+            ("AppleHomeNFC", None, None, "apple nfc device"),
+            ("accesscode", None, "secret code", "keypad - secret code"),
+            ("virtualKey", "user-uuid", None, "mobile device - asdf"),
+            ("virtualKey", "unknown", None, "mobile device"),
+            ("virtualKey", None, None, "mobile device"),
+        ],
+        ids=[
+            "thumbturn",
+            "one_touch_locking",
+            "nfc_device",
+            "nfc_device_no_uuid",
+            "keypad",
+            "mobile_device",
+            "mobile_device_unknown_user",
+            "mobile_device_no_uuid",
+        ],
+    )
+    def test_last_changed_by(
+        self,
+        wifi_lock: Lock,
+        action_type: str,
+        uuid: str | None,
+        name: str | None,
+        want: str,
+    ) -> None:
         assert wifi_lock.lock_state_metadata is not None
-        wifi_lock.lock_state_metadata.action_type = "virtualKey"
-        wifi_lock.lock_state_metadata.uuid = "user-uuid"
-        assert wifi_lock.last_changed_by() == "mobile device - asdf"
-
-        wifi_lock.lock_state_metadata.uuid = "unknown"
-        assert wifi_lock.last_changed_by() == "mobile device"
-
-        wifi_lock.lock_state_metadata.uuid = None
-        assert wifi_lock.last_changed_by() == "mobile device"
+        wifi_lock.lock_state_metadata.action_type = action_type
+        wifi_lock.lock_state_metadata.uuid = uuid
+        wifi_lock.lock_state_metadata.name = name
+        assert wifi_lock.last_changed_by() == want
 
     def test_unknown(self, wifi_lock: Lock) -> None:
         assert wifi_lock.last_changed_by() == "unknown"
@@ -3,13 +3,14 @@ from datetime import datetime
 from pyschlage.log import LockLog
 
 _DEFAULT_UUID = "ffffffff-ffff-ffff-ffff-ffffffffffff"
+_CREATED_AT = datetime(2023, 3, 1, 17, 26, 47, 366000)
 
 
 class TestFromJson:
     def test_unlocked_by_thumbturn(self, log_json):
         log_json["message"]["eventCode"] = 4
         lock_log = LockLog(
-            created_at=datetime(2023, 3, 1, 17, 26, 47, 366000),
+            created_at=_CREATED_AT,
             accessor_id=None,
             access_code_id=None,
             message="Unlocked by thumbturn",
@@ -24,7 +25,7 @@ class TestFromJson:
             }
         )
         lock_log = LockLog(
-            created_at=datetime(2023, 3, 1, 17, 26, 47, 366000),
+            created_at=_CREATED_AT,
             accessor_id=None,
             access_code_id="__access-code-id__",
             message="Unlocked by keypad",
@@ -39,9 +40,13 @@ class TestFromJson:
             }
         )
         lock_log = LockLog(
-            created_at=datetime(2023, 3, 1, 17, 26, 47, 366000),
+            created_at=_CREATED_AT,
             accessor_id="__user-id__",
             access_code_id=None,
             message="Unlocked by mobile device",
         )
         assert LockLog.from_json(log_json) == lock_log
+
+
+def test_dedupe(log_json, lock_log):
+    assert {lock_log, LockLog.from_json(log_json)} == {lock_log}